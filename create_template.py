@@ -2,48 +2,227 @@
 Creates the Harkness Helper spreadsheet template as an .xlsx file.
 Tabs: Settings, Discussions, Students, Transcripts, SpeakerMap, StudentReports, Prompts, Courses
 Headers match exactly what initializeSheetHeaders() in Sheets.gs produces.
+The workbook parts are written directly as OOXML, so only the standard library is needed.
+Default prompt texts for the Prompts tab live in prompts/<name>.txt.
 Run: python3 create_template.py
 """
 
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from html import escape
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
 
-wb = openpyxl.Workbook()
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
 # --- Styles ---
-header_font = Font(name="Arial", size=11, bold=True, color="FFFFFF")
-header_fill = PatternFill(start_color="4285F4", end_color="4285F4", fill_type="solid")
-header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-body_font = Font(name="Arial", size=10)
-body_align = Alignment(vertical="top", wrap_text=True)
-thin_border = Border(
-    left=Side(style="thin", color="CCCCCC"),
-    right=Side(style="thin", color="CCCCCC"),
-    top=Side(style="thin", color="CCCCCC"),
-    bottom=Side(style="thin", color="CCCCCC"),
-)
-
-def style_header(ws, num_cols):
-    for col in range(1, num_cols + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-        cell.border = thin_border
-    ws.freeze_panes = "A2"
-    ws.auto_filter.ref = f"A1:{get_column_letter(num_cols)}1"
+# Indices into <cellXfs> below: the default style, the header row
+# (Arial 11 bold white on blue, centered, thin grey border) and the
+# wrapped, top-aligned prompt text. Colors are full 8-digit ARGB with an
+# opaque (FF) alpha; a 6-digit value would read as alpha 00 (transparent).
+DEFAULT = 0
+HEADER = 1
+PROMPT_BODY = 2
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="{MAIN_NS}">
+<fonts count="2">
+<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>
+<font><b val="1"/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Arial"/></font>
+</fonts>
+<fills count="3">
+<fill><patternFill patternType="none"/></fill>
+<fill><patternFill patternType="gray125"/></fill>
+<fill><patternFill patternType="solid"><fgColor rgb="FF4285F4"/><bgColor rgb="FF4285F4"/></patternFill></fill>
+</fills>
+<borders count="2">
+<border><left/><right/><top/><bottom/><diagonal/></border>
+<border>
+<left style="thin"><color rgb="FFCCCCCC"/></left>
+<right style="thin"><color rgb="FFCCCCCC"/></right>
+<top style="thin"><color rgb="FFCCCCCC"/></top>
+<bottom style="thin"><color rgb="FFCCCCCC"/></bottom>
+<diagonal/>
+</border>
+</borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="3">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center" wrapText="1"/></xf>
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment vertical="top" wrapText="1"/></xf>
+</cellXfs>
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>
+</styleSheet>
+"""
+
+# --- Part templates ---
+SHEET_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="{MAIN_NS}">
+<sheetViews><sheetView workbookViewId="0">
+<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>
+<selection pane="bottomLeft" activeCell="A2" sqref="A2"/>
+</sheetView></sheetViews>
+<sheetFormatPr defaultRowHeight="15"/>
+<cols>{{cols}}</cols>
+<sheetData>{{rows}}</sheetData>{{auto_filter}}
+</worksheet>
+"""
+
+WORKBOOK_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">
+<sheets>{{sheets}}</sheets>
+<definedNames>{{defined_names}}</definedNames>
+</workbook>
+"""
+
+WORKBOOK_RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_REL_NS}">{{rels}}</Relationships>
+"""
+
+SHARED_STRINGS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<sst xmlns="{MAIN_NS}" uniqueCount="{{count}}">{{items}}</sst>
+"""
+
+ROOT_RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>
+"""
+
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
+{overrides}
+</Types>
+"""
+
+SHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+
+def column_letter(index):
+    """Return the column letter(s) for a 1-based column index (1 -> A, 27 -> AA)."""
+    letters = ""
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def string_index(strings, text):
+    return strings.setdefault(text, len(strings))
+
+
+def shared_string_item(text):
+    # Each distinct string (including the multi-KB prompts) is escaped once
+    # here; cells only carry its index.
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f"<si><t{space}>{escape(text, quote=False)}</t></si>"
+
+
+def render_row(strings, row_num, values, styles):
+    cells = []
+    for col, (value, style) in enumerate(zip(values, styles), 1):
+        if not value:
+            continue
+        style_attr = f' s="{style}"' if style else ""
+        cells.append(f'<c r="{column_letter(col)}{row_num}"{style_attr} t="s"><v>{string_index(strings, value)}</v></c>')
+    return f'<row r="{row_num}">{"".join(cells)}</row>'
+
+
+def render_sheet(strings, title, headers, widths, rows=(), column_styles=None):
+    """Render a tab with a frozen header row followed by its data rows.
+
+    Cell text is added to ``strings`` (text -> shared-string index). Only tabs
+    that ship with data rows get an auto-filter over the header. Returns
+    ``(title, last filtered column or None, sheet XML)``.
+    """
+    num_cols = len(headers)
+    body_styles = column_styles or [DEFAULT] * num_cols
+    if len(widths) != num_cols:
+        raise ValueError(f"{title}: {len(widths)} widths for {num_cols} headers")
+    if len(body_styles) != num_cols:
+        raise ValueError(f"{title}: {len(body_styles)} column styles for {num_cols} headers")
+    for n, row in enumerate(rows, 2):
+        if len(row) != num_cols:
+            raise ValueError(f"{title}: row {n} has {len(row)} cells for {num_cols} headers")
+
+    cols = "".join(
+        f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+        for i, w in enumerate(widths, 1)
+    )
+    row_xml = [render_row(strings, 1, headers, [HEADER] * num_cols)]
+    row_xml += [render_row(strings, n, row, body_styles) for n, row in enumerate(rows, 2)]
+    filter_col = column_letter(num_cols) if rows else None
+    xml = SHEET_XML.format(
+        cols=cols,
+        rows="".join(row_xml),
+        auto_filter=f'\n<autoFilter ref="A1:{filter_col}1"/>' if filter_col else "",
+    )
+    return title, filter_col, xml
 
 
 # ============================================================
-# Tab 1: Settings (key-value config)
+# Tabs, in workbook order: (title, headers, column widths)
 # ============================================================
-ws_settings = wb.active
-ws_settings.title = "Settings"
+SHEETS = [
+    # Key-value config
+    ("Settings", ["setting_key", "setting_value"], [30, 50]),
+    (
+        "Discussions",
+        [
+            "status", "next_step", "date", "section", "course",
+            "grade", "approved", "group_feedback",
+            "canvas_assignment_id", "canvas_item_type",
+            "discussion_id", "audio_file_id", "error_message",
+            "created_at", "updated_at",
+        ],
+        [12, 30, 12, 12, 14, 8, 10, 40, 18, 14, 18, 18, 30, 18, 18],
+    ),
+    (
+        "Students",
+        ["name", "email", "section", "course", "canvas_user_id", "student_id"],
+        [22, 28, 14, 14, 14, 18],
+    ),
+    (
+        "Transcripts",
+        [
+            "discussion_id", "raw_transcript", "speaker_map", "named_transcript",
+            "created_at", "updated_at",
+        ],
+        [18, 60, 30, 60, 18, 18],
+    ),
+    (
+        "SpeakerMap",
+        ["discussion_id", "speaker_label", "suggested_name", "student_name", "confirmed"],
+        [18, 14, 20, 20, 10],
+    ),
+    (
+        "StudentReports",
+        [
+            "student_name", "grade", "approved", "sent", "feedback",
+            "discussion_id", "transcript_contributions", "participation_summary",
+            "student_id", "report_id", "created_at", "updated_at",
+        ],
+        [20, 8, 10, 8, 40, 18, 40, 30, 18, 18, 18, 18],
+    ),
+    ("Prompts", ["prompt_name", "prompt_text"], [28, 100]),
+    # Multi-course Canvas config
+    (
+        "Courses",
+        ["course_name", "canvas_course_id", "canvas_base_url", "canvas_item_type"],
+        [24, 18, 36, 14],
+    ),
+]
 
-ws_settings.append(["setting_key", "setting_value"])
-style_header(ws_settings, 2)
 
+# ============================================================
+# Settings defaults
+# ============================================================
 settings_defaults = [
     ["mode", "group"],
     ["distribute_email", "true"],
@@ -59,228 +238,92 @@ settings_defaults = [
     ["canvas_item_type", "assignment"],
 ]
 
-for row in settings_defaults:
-    ws_settings.append(row)
-
-ws_settings.column_dimensions["A"].width = 30
-ws_settings.column_dimensions["B"].width = 50
-
-
-# ============================================================
-# Tab 2: Discussions
-# ============================================================
-ws_disc = wb.create_sheet("Discussions")
-
-disc_headers = [
-    "status", "next_step", "date", "section", "course",
-    "grade", "approved", "group_feedback",
-    "canvas_assignment_id", "canvas_item_type",
-    "discussion_id", "audio_file_id", "error_message",
-    "created_at", "updated_at",
-]
-ws_disc.append(disc_headers)
-style_header(ws_disc, len(disc_headers))
-
-disc_widths = [12, 30, 12, 12, 14, 8, 10, 40, 18, 14, 18, 18, 30, 18, 18]
-for i, w in enumerate(disc_widths, 1):
-    ws_disc.column_dimensions[get_column_letter(i)].width = w
-
-
-# ============================================================
-# Tab 3: Students
-# ============================================================
-ws_stu = wb.create_sheet("Students")
-
-stu_headers = ["name", "email", "section", "course", "canvas_user_id", "student_id"]
-ws_stu.append(stu_headers)
-style_header(ws_stu, len(stu_headers))
-
-stu_widths = [22, 28, 14, 14, 14, 18]
-for i, w in enumerate(stu_widths, 1):
-    ws_stu.column_dimensions[get_column_letter(i)].width = w
-
-
-# ============================================================
-# Tab 4: Transcripts
-# ============================================================
-ws_trans = wb.create_sheet("Transcripts")
-
-trans_headers = [
-    "discussion_id", "raw_transcript", "speaker_map", "named_transcript",
-    "created_at", "updated_at",
-]
-ws_trans.append(trans_headers)
-style_header(ws_trans, len(trans_headers))
-
-trans_widths = [18, 60, 30, 60, 18, 18]
-for i, w in enumerate(trans_widths, 1):
-    ws_trans.column_dimensions[get_column_letter(i)].width = w
-
-
-# ============================================================
-# Tab 5: SpeakerMap
-# ============================================================
-ws_sm = wb.create_sheet("SpeakerMap")
-
-sm_headers = ["discussion_id", "speaker_label", "suggested_name", "student_name", "confirmed"]
-ws_sm.append(sm_headers)
-style_header(ws_sm, len(sm_headers))
-
-sm_widths = [18, 14, 20, 20, 10]
-for i, w in enumerate(sm_widths, 1):
-    ws_sm.column_dimensions[get_column_letter(i)].width = w
-
-
-# ============================================================
-# Tab 6: StudentReports
-# ============================================================
-ws_rep = wb.create_sheet("StudentReports")
-
-rep_headers = [
-    "student_name", "grade", "approved", "sent", "feedback",
-    "discussion_id", "transcript_contributions", "participation_summary",
-    "student_id", "report_id", "created_at", "updated_at",
-]
-ws_rep.append(rep_headers)
-style_header(ws_rep, len(rep_headers))
-
-rep_widths = [20, 8, 10, 8, 40, 18, 40, 30, 18, 18, 18, 18]
-for i, w in enumerate(rep_widths, 1):
-    ws_rep.column_dimensions[get_column_letter(i)].width = w
-
 
 # ============================================================
-# Tab 7: Prompts
+# Prompts
 # ============================================================
-ws_prompts = wb.create_sheet("Prompts")
-
-ws_prompts.append(["prompt_name", "prompt_text"])
-style_header(ws_prompts, 2)
-
-prompts = [
-    [
-        "SPEAKER_IDENTIFICATION",
-        """You are analyzing the beginning of a classroom Harkness discussion recording.
-
-Students typically introduce themselves at the start. Listen for patterns like:
-- "Hi, I'm [name]"
-- "My name is [name]"
-- "This is [name]"
-- "[Name] here"
-- Other natural introductions
-
-Analyze this transcript excerpt and identify which speaker label corresponds to which student name.
-
-IMPORTANT RULES:
-1. Only include speakers you can confidently identify from explicit introductions
-2. If a speaker cannot be identified, map them to "?" instead
-3. Be case-sensitive with names as they appear
-4. The teacher may also speak — if identified, include them as "Teacher"
-
-Return ONLY a valid JSON object mapping speaker labels to names.
-Example format: {"Speaker 0": "Maria", "Speaker 1": "James", "Speaker 2": "Teacher", "Speaker 3": "?"}
-
-Transcript excerpt:
-{transcript}
-
-JSON mapping:""",
-    ],
-    [
-        "GROUP_FEEDBACK",
-        """You are a high school teacher analyzing a Harkness discussion. You will produce exactly two paragraphs.
-
-**PARAGRAPH 1 — Discussion Summary** (Neutral Voice)
-Write in a neutral, objective, third-person voice. Provide a detailed summary of the discussion's main topics and flow. Identify 2-3 "defining moments" — key turning points, breakthrough ideas, or significant challenges that shaped the conversation.
+# One file per prompt in prompts/<name>.txt, read when the template is built
+PROMPT_DIR = Path(__file__).resolve().with_name("prompts")
+PROMPT_NAMES = ("SPEAKER_IDENTIFICATION", "GROUP_FEEDBACK", "INDIVIDUAL_FEEDBACK")
 
-**PARAGRAPH 2 — Evaluative Comment** (Teacher Voice)
-Write in the teacher's voice, directed at the class ("you" plural, "I" for the teacher). The tone must be direct, informal, supportive, and clear. Follow this mandatory "Critique Sandwich" structure:
 
-1. **The Grade**: State the grade clearly and colloquially in the first sentence. (e.g., "This was a strong discussion, earning a solid 8.5 out of 10.", "This was a decent but not great start... 7/10.")
-2. **The Good**: Highlight 2-3 specific positive achievements. Credit specific students by name, linking them to their idea or contribution.
-3. **The Gap**: Identify the primary weakness or area for growth.
-4. **The Next Step**: Conclude with a single, clear, actionable goal for the next discussion.
-
-**Tone alignment with grade:**
-- High grade (9-10): Frame positives as "excellent" or "deep"; the gap is a "final step" to the next level.
-- Medium grade (7-8.5): Balanced ("solid," "decent start") with a more significant gap to work on.
-- Lower grade (below 7): Honest but encouraging; clear gap with concrete next steps.
-
-**Important:**
-- If the teacher gave oral feedback during the discussion (often near the end — look for phrases like "my evaluation," "my feedback," or the teacher summarizing), align your evaluation with their points.
-- Credit specific students by name for notable contributions.
-- If the teacher intervened to guide the discussion, acknowledge this (e.g., "I had to provide the key synthesizing question").
-
-Grade: {grade}
-
-Transcript:
-{transcript}
-
-Write the two paragraphs now (summary paragraph first, then evaluative comment):""",
-    ],
-    [
-        "INDIVIDUAL_FEEDBACK",
-        """You are a high school teacher providing personalized feedback to {student_name} about their Harkness discussion participation. You will produce exactly two paragraphs.
-
-**PARAGRAPH 1 — Contribution Summary** (Neutral Voice)
-Write in a neutral, objective voice. Summarize what {student_name} contributed to the discussion — their main points, arguments, and how they engaged with other students' ideas. Note specific moments where they advanced or redirected the conversation.
-
-**PARAGRAPH 2 — Evaluative Comment** (Teacher Voice)
-Write in the teacher's voice, directed at the student ("you"). The tone must be direct, informal, supportive, and clear. Follow this "Critique Sandwich" structure:
-
-1. **The Grade**: State the grade clearly in the first sentence.
-2. **The Good**: Highlight 2-3 specific strengths from their participation, referencing actual points they made.
-3. **The Gap**: Identify their primary area for growth as a discussion participant.
-4. **The Next Step**: Conclude with a single, actionable goal for their next discussion.
-
-**Tone alignment with grade:**
-- High grade (9-10): "Excellent" contributions; the gap is a stretch goal.
-- Medium grade (7-8.5): "Solid" participation with clear room to grow.
-- Lower grade (below 7): Encouraging but honest about what's missing.
-
-**Important:**
-- If the teacher gave oral feedback during the discussion (often near the end — look for phrases like "my evaluation," "my feedback," or the teacher summarizing), align your evaluation with their points.
-
-Grade: {grade}
-
-{student_name}'s contributions:
-{contributions}
-
-Full discussion transcript (for context):
-{transcript}
-
-Write the two paragraphs now (contribution summary first, then evaluative comment for {student_name}):""",
-    ],
-]
-
-for row in prompts:
-    ws_prompts.append(row)
-
-ws_prompts.column_dimensions["A"].width = 28
-ws_prompts.column_dimensions["B"].width = 100
-
-# Wrap text in prompt_text column
-for row in ws_prompts.iter_rows(min_row=2, min_col=2, max_col=2):
-    for cell in row:
-        cell.alignment = Alignment(wrap_text=True, vertical="top")
+def load_prompts():
+    return [
+        [name, (PROMPT_DIR / f"{name}.txt").read_text(encoding="utf-8").rstrip("\n")]
+        for name in PROMPT_NAMES
+    ]
 
 
 # ============================================================
-# Tab 8: Courses (multi-course Canvas config)
+# Build
 # ============================================================
-ws_courses = wb.create_sheet("Courses")
-
-courses_headers = ["course_name", "canvas_course_id", "canvas_base_url", "canvas_item_type"]
-ws_courses.append(courses_headers)
-style_header(ws_courses, len(courses_headers))
-
-courses_widths = [24, 18, 36, 14]
-for i, w in enumerate(courses_widths, 1):
-    ws_courses.column_dimensions[get_column_letter(i)].width = w
+# Only prompt_text is styled (wrapped); prompt_name keeps the default style
+SHEET_STYLES = {"Prompts": [DEFAULT, PROMPT_BODY]}
+
+
+def build_parts():
+    """Return (part name, XML) pairs for the whole workbook, in archive order."""
+    # Only Settings and Prompts ship with data rows
+    sheet_rows = {"Settings": settings_defaults, "Prompts": load_prompts()}
+    shared_strings = {}  # text -> index in sharedStrings.xml, in first-use order
+    sheets = [
+        render_sheet(
+            shared_strings, title, headers, widths,
+            sheet_rows.get(title, ()), SHEET_STYLES.get(title),
+        )
+        for title, headers, widths in SHEETS
+    ]
+
+    sheet_names = [f"xl/worksheets/sheet{i}.xml" for i in range(1, len(sheets) + 1)]
+    workbook_xml = WORKBOOK_XML.format(
+        sheets="".join(
+            f'<sheet name="{title}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, (title, _, _) in enumerate(sheets, 1)
+        ),
+        defined_names="".join(
+            f'<definedName name="_xlnm._FilterDatabase" localSheetId="{i}" hidden="1">'
+            f"'{title}'!$A$1:${filter_col}$1</definedName>"
+            for i, (title, filter_col, _) in enumerate(sheets)
+            if filter_col
+        ),
+    )
+    rel_targets = [("worksheet", f"worksheets/sheet{i}.xml") for i in range(1, len(sheets) + 1)]
+    rel_targets += [("styles", "styles.xml"), ("sharedStrings", "sharedStrings.xml")]
+    workbook_rels_xml = WORKBOOK_RELS_XML.format(rels="".join(
+        f'<Relationship Id="rId{i}" Type="{REL_NS}/{rel_type}" Target="{target}"/>'
+        for i, (rel_type, target) in enumerate(rel_targets, 1)
+    ))
+    shared_strings_xml = SHARED_STRINGS_XML.format(
+        count=len(shared_strings),
+        items="".join(shared_string_item(text) for text in shared_strings),
+    )
+    content_types_xml = CONTENT_TYPES_XML.format(overrides="\n".join(
+        f'<Override PartName="/{name}" ContentType="{SHEET_CONTENT_TYPE}"/>' for name in sheet_names
+    ))
+
+    return [
+        ("[Content_Types].xml", content_types_xml),
+        ("_rels/.rels", ROOT_RELS_XML),
+        ("xl/workbook.xml", workbook_xml),
+        ("xl/_rels/workbook.xml.rels", workbook_rels_xml),
+        ("xl/styles.xml", STYLES_XML),
+        ("xl/sharedStrings.xml", shared_strings_xml),
+        *((name, xml) for name, (_, _, xml) in zip(sheet_names, sheets)),
+    ]
 
 
 # ============================================================
 # Save
 # ============================================================
-output_path = "Harkness_Helper_Template.xlsx"
-wb.save(output_path)
-print(f"Template saved to: {output_path}")
+def main(output_path="Harkness_Helper_Template.xlsx"):
+    # Assemble the archive in memory, then hit the disk with a single write
+    buf = BytesIO()
+    with ZipFile(buf, "w", ZIP_DEFLATED) as zf:
+        for name, xml in build_parts():
+            zf.writestr(name, xml)
+    Path(output_path).write_bytes(buf.getbuffer())
+    print(f"Template saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()